@@ -46,6 +46,16 @@ from sardana.pool import AcqSynch, AcqMode
 
 class ValueBuffer(SardanaBuffer):
 
+    def __init__(self, *args, **kwargs):
+        super(ValueBuffer, self).__init__(*args, **kwargs)
+        self._pseudo_value_buffers = None
+
+    def invalidate_pseudo_elements(self):
+        """Forget the cached value buffers of the pseudo elements. Must be
+        called whenever pseudo elements are added to or removed from the
+        channel."""
+        self._pseudo_value_buffers = None
+
     def is_value_required(self, idx):
         """Check whether any of pseudo elements still still requires
         this value.
@@ -55,8 +65,16 @@ class ValueBuffer(SardanaBuffer):
         :return: whether value is required or can be freely removed
         :rtype: bool
         """
-        for element in self.obj.get_pseudo_elements():
-            if element().get_value_buffer().next_idx <= idx:
+        # keep just weak references - the value buffers must not outlive
+        # their pseudo elements
+        value_buffers = self._pseudo_value_buffers
+        if value_buffers is None:
+            value_buffers = self._pseudo_value_buffers = [
+                weakref.ref(element().get_value_buffer())
+                for element in self.obj.get_pseudo_elements()]
+        for value_buffer in value_buffers:
+            value_buffer = value_buffer()
+            if value_buffer is not None and value_buffer.next_idx <= idx:
                 return True
         return False
 
@@ -154,6 +172,7 @@ class PoolBaseChannel(PoolElement):
         if not self.has_pseudo_elements():
             self.get_value_buffer().persistent = True
         self._pseudo_elements.append(weakref.ref(element))
+        self.get_value_buffer().invalidate_pseudo_elements()
 
     def remove_pseudo_element(self, element):
         """Removes pseudo element e.g. pseudo counters that this channel
@@ -168,6 +187,7 @@ class PoolBaseChannel(PoolElement):
                 self._pseudo_elements.remove(pseudo_element)
                 if not self.has_pseudo_elements():
                     self.get_value_buffer().persistent = False
+                self.get_value_buffer().invalidate_pseudo_elements()
                 break
         else:
             raise ValueError(
@@ -345,6 +365,10 @@ class PoolBaseChannel(PoolElement):
         be added with right after the last value in the buffer. Also update
         the read value.
 
+        Every call fires the value buffer and value events. To add several
+        values at once use :meth:`extend_value_buffer` which fires them just
+        once.
+
         :param value:
             value to be added to the buffer
         :type value:
@@ -99,10 +99,7 @@ class PoolElement(PoolBaseElement):
         """
         dependent_elements = []
         for listener in self.get_listeners():
-            try:
-                elem = listener().__self__
-            except AttributeError:
-                continue
+            elem = getattr(listener(), "__self__", None)
             if isinstance(elem, PoolBaseElement):
                 dependent_elements.append(elem)
         
@@ -54,6 +54,24 @@ class FakePool(object):
     def get_element(self, id):
         return self.elements[id]
 
+    def delete_element(self, name):
+        for elem in self.elements.values():
+            if elem.name == name:
+                break
+        else:
+            raise Exception("There is no element with name '%s'" % name)
+        dependent_elements = elem.get_dependent_elements()
+        if len(dependent_elements) > 0:
+            names = [elem.name for elem in dependent_elements]
+            raise Exception("The element {} can't be deleted because {} "
+                            "depend on it.".format(name, ", ".join(names)))
+        if hasattr(elem, "get_controller"):
+            elem.get_controller().remove_element(elem)
+        del self.elements[elem.id]
+        del self.elements_by_full_name[elem.full_name]
+        if hasattr(elem, "get_controller"):
+            elem.set_deleted(True)
+
     def get_element_by_full_name(self, full_name):
         return self.elements_by_full_name[full_name]
 
@@ -23,6 +23,8 @@
 ##
 ##############################################################################
 
+import gc
+import weakref
 from unittest import TestCase
 
 from sardana.pool.test.base import BasePoolTestCase
@@ -68,3 +70,30 @@ class PseudoCounterTestCase(BasePoolTestCase, TestCase):
         self.ct2.append_value_buffer(10., idx=9)
         self.assertEqual(len(pc_value_buffer.last_chunk), 1)
         self.assertEqual(pc_value_buffer.last_chunk[9].value, 1)
+
+    def test_value_required_by_pseudocounter(self):
+        """Test that the physical counter values are kept only as long as
+        the pseudo counter still needs them.
+        """
+        ct1_value_buffer = self.ct1.get_value_buffer()
+        self.ct1.extend_value_buffer([1., 2.])
+        self.assertTrue(ct1_value_buffer.is_value_required(0))
+        self.ct1.remove_pseudo_element(self.pc)
+        self.assertFalse(ct1_value_buffer.is_value_required(0))
+
+    def test_pseudocounter_deleted(self):
+        """Test that the physical counter does not keep the pseudo counter
+        value buffer alive once the pseudo counter is gone (without being
+        explicitly removed from the pseudo elements of the counter).
+        """
+        ct1_value_buffer = self.ct1.get_value_buffer()
+        self.ct1.extend_value_buffer([1., 2.])
+        self.assertTrue(ct1_value_buffer.is_value_required(0))
+        pc_value_buffer = weakref.ref(self.pc.get_value_buffer())
+        self.pool.delete_element("pc1")
+        del self.pcs["pc1"]
+        del self.pc
+        gc.collect()
+        self.assertIsNone(pc_value_buffer())
+        self.ct1.extend_value_buffer([3., 4.])
+        self.assertFalse(ct1_value_buffer.is_value_required(0))
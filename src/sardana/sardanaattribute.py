@@ -40,11 +40,22 @@ from .sardanaevent import EventGenerator, EventType
 from .sardanadefs import ScalarNumberFilter, AttrQuality
 from .sardanavalue import SardanaValue
 
+_from_ts = datetime.datetime.fromtimestamp
+
+
+def _accept_all(a, b):
+    """Default attribute filter: any new value is propagated"""
+    return True
+
 
 class SardanaAttribute(EventGenerator):
     """Class representing an atomic attribute like position of a motor or a
     counter value"""
 
+    #: event types shared by all attributes, by (name, priority)
+    _read_event_types = {}
+    _write_event_types = {}
+
     def __init__(self, obj, name=None, initial_value=None, **kwargs):
         super(SardanaAttribute, self).__init__(**kwargs)
         if obj is not None:
@@ -55,7 +66,7 @@ class SardanaAttribute(EventGenerator):
         self._last_event_value = None
         self._w_value = None
         self._quality = AttrQuality.Valid
-        self.filter = lambda a, b: True
+        self.filter = _accept_all
         self.config = SardanaAttributeConfiguration()
         if initial_value is not None:
             self.set_value(initial_value)
@@ -88,9 +99,6 @@ class SardanaAttribute(EventGenerator):
         :return: the object which *owns* this attribute
         :rtype: :obj:`object`
         """
-        return self._get_obj()
-
-    def _get_obj(self):
         obj = self._obj
         if obj is not None:
             obj = obj()
@@ -104,7 +112,8 @@ class SardanaAttribute(EventGenerator):
         return self._in_error()
 
     def _in_error(self):
-        return self.has_value() and self._r_value.error
+        r_value = self._r_value
+        return r_value is not None and r_value.error
 
     def set_value(self, value, exc_info=None, timestamp=None, propagate=1):
         """Sets the current read value and propagates the event (if
@@ -130,6 +139,8 @@ class SardanaAttribute(EventGenerator):
     def _set_value(self, value, exc_info=None, timestamp=None, propagate=1):
         if isinstance(value, SardanaValue):
             rvalue = value
+        elif exc_info is None and timestamp is None:
+            rvalue = SardanaValue.from_value(value)
         else:
             rvalue = SardanaValue(
                 value=value, exc_info=exc_info, timestamp=timestamp)
@@ -182,6 +193,8 @@ class SardanaAttribute(EventGenerator):
     def _set_write_value(self, w_value, timestamp=None, propagate=1):
         if isinstance(w_value, SardanaValue):
             wvalue = w_value
+        elif timestamp is None:
+            wvalue = SardanaValue.from_value(w_value)
         else:
             wvalue = SardanaValue(value=w_value, timestamp=timestamp)
         self._w_value = wvalue
@@ -197,7 +210,7 @@ class SardanaAttribute(EventGenerator):
         return self._get_write_value()
 
     def _get_write_value(self):
-        w_value = self.get_write_value_obj()
+        w_value = self._w_value
         if w_value is not None:
             return w_value.value
 
@@ -207,9 +220,6 @@ class SardanaAttribute(EventGenerator):
         :return: the last write value for this attribute or None if value has
                  not been written yet
         :rtype: :class:`~sardana.sardanavalue.SardanaValue`"""
-        return self._get_write_value_obj()
-
-    def _get_write_value_obj(self):
         if self.has_write_value():
             return self._w_value
 
@@ -229,15 +239,14 @@ class SardanaAttribute(EventGenerator):
         return self._get_exc_info()
 
     def _get_exc_info(self):
-        exc_info = None
-        if self.has_value():
-            exc_info = self._r_value.exc_info
-        return exc_info
+        r_value = self._r_value
+        if r_value is not None:
+            return r_value.exc_info
 
     def accepts(self, propagate):
         if propagate < 1:
             return False
-        if self._last_event_value is None:
+        if self._last_event_value is None or self.filter is _accept_all:
             return True
         return propagate > 1 or self.filter(self.get_value(), self._last_event_value.value)
 
@@ -250,8 +259,9 @@ class SardanaAttribute(EventGenerator):
         return self._get_timestamp()
 
     def _get_timestamp(self):
-        if self.has_value():
-            return self._r_value.timestamp
+        r_value = self._r_value
+        if r_value is not None:
+            return r_value.timestamp
 
     def get_write_timestamp(self):
         """Returns the timestamp of the last write or None if the attribute
@@ -262,8 +272,9 @@ class SardanaAttribute(EventGenerator):
         return self._get_write_timestamp()
 
     def _get_write_timestamp(self):
-        if self.has_write_value():
-            return self._w_value.timestamp
+        w_value = self._w_value
+        if w_value is not None:
+            return w_value.timestamp
 
     def fire_write_event(self, propagate=1):
         """Fires an event to the listeners of the object which owns this
@@ -274,7 +285,11 @@ class SardanaAttribute(EventGenerator):
         :type propagate: int"""
         if propagate < 1:
             return
-        evt_type = EventType("w_" + self.name, priority=propagate)
+        key = self.name, propagate
+        evt_type = self._write_event_types.get(key)
+        if evt_type is None:
+            evt_type = EventType("w_" + self.name, priority=propagate)
+            self._write_event_types[key] = evt_type
         self.fire_event(evt_type, self)
 
     def fire_read_event(self, propagate=1):
@@ -284,12 +299,25 @@ class SardanaAttribute(EventGenerator):
         :param propagate:
             0 for not propagating, 1 to propagate, 2 propagate with priority
         :type propagate: int"""
-        if self.accepts(propagate):
-            obj = self.obj
-            if obj is not None:
-                self._last_event_value = self._r_value
-                evt_type = EventType(self.name, priority=propagate)
-                self.fire_event(evt_type, self)
+        # same as accepts() but inlined - this is called on every readout
+        if propagate < 1:
+            return
+        last_event_value = self._last_event_value
+        filter_ = self.filter
+        if last_event_value is not None and propagate <= 1 and \
+                filter_ is not _accept_all and \
+                not filter_(self.get_value(), last_event_value.value):
+            return
+        obj = self._obj
+        if obj is None or obj() is None:
+            return
+        self._last_event_value = self._r_value
+        key = self.name, propagate
+        evt_type = self._read_event_types.get(key)
+        if evt_type is None:
+            evt_type = EventType(self.name, priority=propagate)
+            self._read_event_types[key] = evt_type
+        self.fire_event(evt_type, self)
 
     obj = property(get_obj, "container object for this attribute")
     value_obj = property(get_value_obj)
@@ -316,12 +344,12 @@ class SardanaAttribute(EventGenerator):
     def __str__(self):
         if self.has_value():
             value = "{0} at {1}".format(
-                self.value, datetime.datetime.fromtimestamp(self.timestamp))
+                self.get_value(), _from_ts(self.get_timestamp()))
         else:
             value = "-----"
         if self.has_write_value():
             w_value = "{0} at {1}".format(
-                self.w_value, datetime.datetime.fromtimestamp(self.w_timestamp))
+                self.get_write_value(), _from_ts(self.get_write_timestamp()))
         else:
             w_value = "-----"
 
@@ -369,13 +397,19 @@ class SardanaSoftwareAttribute(SardanaAttribute):
 class ScalarNumberAttribute(SardanaAttribute):
     """A :class:`SardanaAttribute` specialized for numbers"""
 
+    #: ScalarNumberFilter is stateless so all instances share the same one
+    _default_filter = ScalarNumberFilter()
+
     def __init__(self, *args, **kwargs):
         SardanaAttribute.__init__(self, *args, **kwargs)
-        self.filter = ScalarNumberFilter()
+        self.filter = self._default_filter
 
 
 class SardanaAttributeConfiguration(object):
     """Storage class for :class:`SardanaAttribute` information (like ranges)"""
+
+    __slots__ = 'range', 'alarm', 'warning'
+
     NoRange = float('-inf'), float('inf')
 
     def __init__(self):
@@ -34,6 +34,8 @@ import weakref
 
 from collections import OrderedDict
 
+import numpy
+
 from .sardanavalue import SardanaValue
 from .sardanaevent import EventGenerator, EventType
 from .sardanaexception import SardanaException
@@ -83,9 +85,13 @@ class SardanaBuffer(EventGenerator):
         self._obj = obj
         self.name = name or self.__class__.__name__
         self._persistent = persistent
-        self._buffer = OrderedDict()
+        # values are always accessed by their idx so the order of the
+        # buffer does not matter and a plain dict is enough
+        self._buffer = {}
         self._next_idx = 0
-        self._last_chunk = None
+        # the same OrderedDict is reused for every chunk - the listeners
+        # rely on the chunk being ordered by index
+        self._last_chunk = OrderedDict()
 
     def __len__(self):
         return self._buffer.__len__()
@@ -133,6 +139,9 @@ class SardanaBuffer(EventGenerator):
     def append(self, value, idx=None):
         """Append a single value at the end of the buffer with a given index.
 
+        Every call fires an event to the listeners. To add several values at
+        once use :meth:`extend` which fires just one event.
+
         :param value: value to be appended to the buffer
         :type param: SardanaValue or any object
         :param idx: at which index append the value, None means append at the
@@ -144,10 +153,11 @@ class SardanaBuffer(EventGenerator):
         """
         if idx is None:
             idx = self._next_idx
-        self._last_chunk = OrderedDict()
         if not isinstance(value, SardanaValue):
-            value = SardanaValue(value)
-        self._last_chunk[idx] = value
+            value = SardanaValue.from_value(value)
+        last_chunk = self._last_chunk
+        last_chunk.clear()
+        last_chunk[idx] = value
         if self._persistent:
             self._buffer[idx] = value
         self._next_idx = idx + 1
@@ -166,14 +176,23 @@ class SardanaBuffer(EventGenerator):
         """
         if initial_idx is None:
             initial_idx = self._next_idx
-        self._last_chunk = OrderedDict()
-        for idx, value in enumerate(values, initial_idx):
-            if not isinstance(value, SardanaValue):
-                value = SardanaValue(value)
-            self._last_chunk[idx] = value
-            if self._persistent:
-                self._buffer[idx] = value
-        self._next_idx = idx + 1
+        # iterating over a numpy array yields numpy scalars which are
+        # expensive to create one by one - convert the numeric 1D arrays
+        # to a list of Python numbers in one go
+        if isinstance(values, numpy.ndarray) and values.ndim == 1 \
+                and values.dtype.kind in "biuf":
+            values = values.tolist()
+        values = [value if isinstance(value, SardanaValue)
+                  else SardanaValue.from_value(value) for value in values]
+        if not values:
+            return
+        next_idx = initial_idx + len(values)
+        last_chunk = self._last_chunk
+        last_chunk.clear()
+        last_chunk.update(zip(range(initial_idx, next_idx), values))
+        if self._persistent:
+            self._buffer.update(last_chunk)
+        self._next_idx = next_idx
         self.fire_add_event()
 
     def remove(self, idx):
@@ -203,9 +222,19 @@ class SardanaBuffer(EventGenerator):
 
     def clear(self):
         self._next_idx = 0
-        self._buffer = OrderedDict()
+        self._buffer = {}
 
     def get_last_chunk(self):
+        """Returns the chunk with the last value(s) added to this buffer.
+
+        .. note::
+            The same OrderedDict is reused and refilled on every
+            :meth:`append` and :meth:`extend`. Listeners which need to keep
+            the chunk beyond the event handling must copy it.
+
+        :return: last chunk - index to value object mapping
+        :rtype: OrderedDict<int, SardanaValue>
+        """
         return self._last_chunk
 
     def get_next_idx(self):
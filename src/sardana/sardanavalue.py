@@ -37,6 +37,12 @@ import time
 
 class SardanaValue(object):
 
+    # defaults for the values created with from_value()
+    error = False
+    exc_info = None
+    dtype = None
+    dformat = None
+
     def __init__(self, value=None, exc_info=None, timestamp=None,
                  dtype=None, dformat=None):
         self.value = value
@@ -48,6 +54,22 @@ class SardanaValue(object):
         self.dtype = dtype
         self.dformat = dformat
 
+    @classmethod
+    def from_value(cls, value):
+        """Creates a non error value with a 'now' timestamp. Equivalent to
+        ``SardanaValue(value)`` but cheaper since it skips the constructor
+        arguments handling.
+
+        :param value: the value
+        :type value: :obj:`object`
+        :return: the new value object
+        :rtype: :class:`SardanaValue`
+        """
+        obj = cls.__new__(cls)
+        obj.value = value
+        obj.timestamp = time.time()
+        return obj
+
     def __repr__(self):
         v = None
         if self.error:
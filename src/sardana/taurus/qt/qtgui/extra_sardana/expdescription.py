@@ -29,7 +29,9 @@
 __all__ = ["ExpDescriptionEditor"]
 
 
+import bisect
 import json
+import pickle
 
 try:
     # import QtWebEngineWidgets before QApplication is instantiated
@@ -40,6 +42,7 @@ from taurus.external.qt import Qt, QtCore, QtGui, compat
 import copy
 import taurus
 import taurus.core
+from taurus.core.util.containers import CaselessDict
 from taurus.qt.qtgui.base import TaurusBaseWidget
 
 from sardana.taurus.qt.qtcore.tango.sardana.model import SardanaBaseProxyModel, SardanaTypeTreeItem
@@ -83,6 +86,32 @@ def _to_fqdn(name, logger=None):
     return full_name
 
 
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+# deleted measurement groups are kept as None in the configuration
+_NOT_FOUND = object()
+
+
+def _fast_clone(obj):
+    """Helper to clone the experiment configuration dictionary. It is a
+    specialized (and faster) replacement of :func:`copy.deepcopy` for trees
+    of dicts, lists, tuples and CaselessDicts with immutable leaves. Any
+    other object, including other dictionary subclasses, is deep copied.
+    """
+    cls = type(obj)
+    if cls is dict:
+        return {k: _fast_clone(v) for k, v in obj.items()}
+    if cls is list:
+        return [_fast_clone(v) for v in obj]
+    if cls is tuple:
+        return tuple([_fast_clone(v) for v in obj])
+    if cls in _IMMUTABLE_TYPES:
+        return obj
+    if cls is CaselessDict:
+        return CaselessDict([(k, _fast_clone(v)) for k, v in obj.items()])
+    return copy.deepcopy(obj)
+
+
 class SardanaAcquirableProxyModel(SardanaBaseProxyModel):
     #    ALLOWED_TYPES = 'Acquirable'
     #
@@ -182,15 +211,20 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
     '''
 
     createExpConfChangedDialog = Qt.pyqtSignal()
+    # emitted with a copy of the configuration read from (or written to)
+    # the door, receivers are free to keep and modify it
     experimentConfigurationChanged = Qt.pyqtSignal(compat.PY_OBJECT)
 
     def __init__(self, parent=None, door=None, autoUpdate=False):
         Qt.QWidget.__init__(self, parent)
         TaurusBaseWidget.__init__(self, 'ExpDescriptionEditor')
         self.loadUi()
-        self.ui.buttonBox.setStandardButtons(
+        self._btnBox = self.ui.buttonBox
+        self._mntGrpCB = self.ui.activeMntGrpCB
+        self._chModel = self.ui.channelEditor.getQModel()
+        self._btnBox.setStandardButtons(
             Qt.QDialogButtonBox.Reset | Qt.QDialogButtonBox.Apply)
-        self.ui.buttonBox.button(Qt.QDialogButtonBox.Reset).setText('Reload')
+        self._btnBox.button(Qt.QDialogButtonBox.Reset).setText('Reload')
 
         newperspectivesDict = copy.deepcopy(
             self.ui.sardanaElementTree.KnownPerspectives)
@@ -226,7 +260,7 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
 
         self.createExpConfChangedDialog.connect(
             self._createExpConfChangedDialog)
-        self.ui.activeMntGrpCB.activated['QString'].connect(
+        self._mntGrpCB.activated['QString'].connect(
             self.changeActiveMntGrp)
         self.ui.createMntGrpBT.clicked.connect(
             self.createMntGrp)
@@ -238,10 +272,26 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
             self.onPathLEEdited)
         self.ui.filenameLE.textEdited.connect(
             self.onFilenameLEEdited)
-        self.ui.channelEditor.getQModel().dataChanged.connect(
-            self._updateButtonBox)
-        self.ui.channelEditor.getQModel().modelReset.connect(
-            self._updateButtonBox)
+        self.ui.filenameLE.editingFinished.connect(
+            self._flushPendingFilename)
+        # connect the channel model signals only after the first
+        # configuration was loaded - during the set-up the button box is
+        # updated by _setDirty
+        self._deferredConnections = [
+            (self._chModel.dataChanged, self._scheduleButtonBoxUpdate),
+            (self._chModel.modelReset, self._scheduleButtonBoxUpdate)
+        ]
+        # coalesce the bursts of channel model changes (e.g. one
+        # dataChanged per edited cell) into a single button box update
+        self._buttonBoxTimer = Qt.QTimer(self)
+        self._buttonBoxTimer.setSingleShot(True)
+        self._buttonBoxTimer.setInterval(0)
+        self._buttonBoxTimer.timeout.connect(self._updateButtonBox)
+        # parse the file names only once the user stops typing
+        self._filenameTimer = Qt.QTimer(self)
+        self._filenameTimer.setSingleShot(True)
+        self._filenameTimer.setInterval(150)
+        self._filenameTimer.timeout.connect(self._commitFilename)
         preScanList = self.ui.preScanList
         preScanList.dataChangedSignal.connect(self.onPreScanSnapshotChanged)
         self.ui.choosePathBT.clicked.connect(
@@ -250,11 +300,12 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
         if door is not None:
             self.setModel(door)
 
-        self.ui.buttonBox.clicked.connect(self.onDialogButtonClicked)
+        self._btnBox.clicked.connect(self.onDialogButtonClicked)
 
         # Taurus Configuration properties and delegates
         self.registerConfigDelegate(self.ui.channelEditor)
 
+    @Qt.pyqtSlot(bool)
     def setAutoUpdate(self, auto_update):
         if auto_update and not self._autoUpdate:
             self._warningWidget = self._getWarningWidget()
@@ -347,7 +398,7 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
         if result == Qt.QMessageBox.Ok:
             self._reloadConf(force=True)
         elif result == Qt.QMessageBox.Cancel:
-            self.ui.buttonBox.setEnabled(True)
+            self._btnBox.setEnabled(True)
 
     @QtCore.pyqtSlot()
     def _experimentConfigurationChanged(self):
@@ -383,15 +434,17 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
         '''reimplemented from :class:`TaurusBaseWidget`'''
         return taurus.core.taurusdevice.TaurusDevice
 
+    @Qt.pyqtSlot()
     def onChooseScanDirButtonClicked(self):
         ret = Qt.QFileDialog.getExistingDirectory(
             self, 'Choose directory for saving files', self.ui.pathLE.text())
         if ret:
             self.ui.pathLE.setText(ret)
-            self.ui.pathLE.textEdited.emit(ret)
+            self.onPathLEEdited(ret)
 
+    @Qt.pyqtSlot('QAbstractButton*')
     def onDialogButtonClicked(self, button):
-        role = self.ui.buttonBox.buttonRole(button)
+        role = self._btnBox.buttonRole(button)
         if role == Qt.QDialogButtonBox.ApplyRole:
             if not self.writeExperimentConfiguration(ask=False):
                 self._reloadConf(force=True)
@@ -400,6 +453,7 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
 
     def closeEvent(self, event):
         '''This event handler receives widget close events'''
+        self._flushPendingFilename()
         if self.isDataChanged():
             self.writeExperimentConfiguration(ask=True)
         Qt.QWidget.closeEvent(self, event)
@@ -408,6 +462,7 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
         '''reimplemented from :class:`TaurusBaseWidget`'''
         TaurusBaseWidget.setModel(self, model)
         self._reloadConf(force=True)
+        self._connectDeferred()
         # set the model of some child widgets
         door = self.getModelObj()
         if door is None:
@@ -420,6 +475,11 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
         door.experimentConfigurationChanged.connect(
             self._experimentConfigurationChanged)
 
+    def _connectDeferred(self):
+        for signal, slot in self._deferredConnections:
+            signal.connect(slot)
+        self._deferredConnections = []
+
     def _reloadConf(self, force=False):
         if not force and self.isDataChanged():
             op = Qt.QMessageBox.question(self, "Reload info from door",
@@ -431,24 +491,43 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
         if door is None:
             return
         conf = door.getExperimentConfiguration()
-        self._originalConfiguration = copy.deepcopy(conf)
+        self._setOriginalConfiguration(conf)
         self.setLocalConfig(conf)
         # Flag as "dirty" if some config was changed during the set-up
-        self._setDirty(self._localConfig != self._originalConfiguration)
-        self._dirtyMntGrps = set()
+        original = self.getOriginalConfiguration()
+        self._setDirty(self._localConfig != original)
+        self._dirtyMntGrps.clear()
         # set a list of available channels
-        avail_channels = {}
-        for ch_info in \
-                list(door.macro_server.getExpChannelElements().values()):
-            avail_channels[ch_info.full_name] = ch_info.getData()
-        self.ui.channelEditor.getQModel().setAvailableChannels(avail_channels)
+        ch_elements = door.macro_server.getExpChannelElements()
+        avail_channels = {ch_info.full_name: ch_info.getData()
+                          for ch_info in ch_elements.values()}
+        self._chModel.setAvailableChannels(avail_channels)
         # set a list of available triggers
-        avail_triggers = {'software': {"name": "software"}}
         tg_elements = door.macro_server.getElementsOfType('TriggerGate')
-        for tg_info in list(tg_elements.values()):
-            avail_triggers[tg_info.full_name] = tg_info.getData()
-        self.ui.channelEditor.getQModel().setAvailableTriggers(avail_triggers)
-        self.experimentConfigurationChanged.emit(copy.deepcopy(conf))
+        avail_triggers = {'software': {"name": "software"}}
+        avail_triggers.update((tg_info.full_name, tg_info.getData())
+                              for tg_info in tg_elements.values())
+        self._chModel.setAvailableTriggers(avail_triggers)
+        # the restored original is not referenced by the widget any more
+        # so it can be emitted without another copy
+        self.experimentConfigurationChanged.emit(original)
+
+    def _setOriginalConfiguration(self, conf):
+        # keep the pristine configuration as a pickled snapshot - it is
+        # cheaper than a live copy and only needs to be restored on demand
+        self._originalConfiguration = pickle.dumps(
+            conf, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def getOriginalConfiguration(self):
+        """Returns a copy of the configuration as it was last read from
+        (or written to) the door
+
+        :return: (dict) the original configuration or None if it was not
+                 read yet
+        """
+        if self._originalConfiguration is None:
+            return None
+        return pickle.loads(self._originalConfiguration)
 
     def _setDirty(self, dirty):
         self._dirty = dirty
@@ -459,10 +538,17 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
 
         :return: (bool) True if he local data has been modified since it was last refreshed
         """
-        return bool(self._dirty or self.ui.channelEditor.getQModel().isDataChanged() or self._dirtyMntGrps)
+        return bool(self._dirty or self._dirtyMntGrps
+                    or self._chModel.isDataChanged())
+
+    @Qt.pyqtSlot()
+    def _scheduleButtonBoxUpdate(self):
+        self._buttonBoxTimer.start()
 
+    @Qt.pyqtSlot()
     def _updateButtonBox(self, *args, **kwargs):
-        self.ui.buttonBox.setEnabled(self.isDataChanged())
+        self._buttonBoxTimer.stop()
+        self._btnBox.setEnabled(self.isDataChanged())
 
     def getLocalConfig(self):
         return self._localConfig
@@ -470,27 +556,41 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
     def setLocalConfig(self, conf):
         '''gets a ExpDescription dictionary and sets up the widget'''
 
+        # discard the file names being edited
+        self._filenameTimer.stop()
         self._localConfig = conf
 
         # set the Channel Editor
         activeMntGrpName = self._localConfig['ActiveMntGrp'] or ''
-        if activeMntGrpName in self._localConfig['MntGrpConfigs']:
-            mgconfig = self._localConfig['MntGrpConfigs'][activeMntGrpName]
-            self.ui.channelEditor.getQModel().setDataSource(mgconfig)
+        mntGrpConfigs = self._localConfig['MntGrpConfigs']
+        if activeMntGrpName in mntGrpConfigs:
+            mgconfig = mntGrpConfigs[activeMntGrpName]
+            self._chModel.setDataSource(mgconfig)
         else:
-            self.ui.channelEditor.getQModel().setDataSource({})
+            mgconfig = None
+            self._chModel.setDataSource({})
 
         # set the measurement group ComboBox
-        self.ui.activeMntGrpCB.clear()
-        mntGrpLabels = []
-        for _, mntGrpConf in list(self._localConfig['MntGrpConfigs'].items()):
-            # get labels to visualize names with lower and upper case
-            mntGrpLabels.append(mntGrpConf['label'])
-        self.ui.activeMntGrpCB.addItems(sorted(mntGrpLabels))
-        idx = self.ui.activeMntGrpCB.findText(activeMntGrpName,
-                                              # case insensitive find
-                                              Qt.Qt.MatchFixedString)
-        self.ui.activeMntGrpCB.setCurrentIndex(idx)
+        # get labels to visualize names with lower and upper case
+        mntGrpLabels = sorted(
+            mntGrpConf['label'] for mntGrpConf in mntGrpConfigs.values())
+        # refill the ComboBox silently, only the final selection is notified
+        self._mntGrpCB.blockSignals(True)
+        try:
+            self._mntGrpCB.clear()
+            self._mntGrpCB.addItems(mntGrpLabels)
+            self._mntGrpCB.setCurrentIndex(-1)
+        finally:
+            self._mntGrpCB.blockSignals(False)
+        # the active measurement group label is known so its index can be
+        # found in the sorted labels instead of searching the ComboBox
+        idx = -1
+        if mgconfig is not None:
+            label = mgconfig['label']
+            i = bisect.bisect_left(mntGrpLabels, label)
+            if i < len(mntGrpLabels) and mntGrpLabels[i] == label:
+                idx = i
+        self._mntGrpCB.setCurrentIndex(idx)
 
         # set the system snapshot list
         # I get it before clearing because clear() changes the _localConfig
@@ -523,6 +623,7 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
             if op != Qt.QMessageBox.Yes:
                 return False
 
+        self._flushPendingFilename()
         conf = self.getLocalConfig()
 
         # make sure that no empty measurement groups are written
@@ -536,7 +637,7 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
                 return False
 
         # check if the currently displayed mntgrp is changed
-        if self.ui.channelEditor.getQModel().isDataChanged():
+        if self._chModel.isDataChanged():
             self._dirtyMntGrps.add(self._localConfig['ActiveMntGrp'])
 
         door = self.getModelObj()
@@ -546,11 +647,11 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
             Qt.QMessageBox.critical(self, 'Wrong configuration',
                                     '{0}'.format(e))
             return False
-        self._originalConfiguration = copy.deepcopy(conf)
-        self._dirtyMntGrps = set()
-        self.ui.channelEditor.getQModel().setDataChanged(False)
+        self._setOriginalConfiguration(conf)
+        self._dirtyMntGrps.clear()
+        self._chModel.setDataChanged(False)
         self._setDirty(False)
-        self.experimentConfigurationChanged.emit(copy.deepcopy(conf))
+        self.experimentConfigurationChanged.emit(_fast_clone(conf))
         return True
 
     @Qt.pyqtSlot('QString')
@@ -559,24 +660,26 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
             return
         if activeMntGrpName == self._localConfig['ActiveMntGrp']:
             return  # nothing changed
-        if activeMntGrpName not in self._localConfig['MntGrpConfigs']:
+        mgconfig = self._localConfig['MntGrpConfigs'].get(activeMntGrpName,
+                                                          _NOT_FOUND)
+        if mgconfig is _NOT_FOUND:
             raise KeyError('Unknown measurement group "%s"' % activeMntGrpName)
 
         # add the previous measurement group to the list of "dirty" groups if
         # something was changed
-        if self.ui.channelEditor.getQModel().isDataChanged():
+        if self._chModel.isDataChanged():
             self._dirtyMntGrps.add(self._localConfig['ActiveMntGrp'])
 
         self._localConfig['ActiveMntGrp'] = activeMntGrpName
 
-        i = self.ui.activeMntGrpCB.findText(activeMntGrpName,
-                                            # case insensitive find
-                                            Qt.Qt.MatchFixedString)
-        self.ui.activeMntGrpCB.setCurrentIndex(i)
-        mgconfig = self._localConfig['MntGrpConfigs'][activeMntGrpName]
-        self.ui.channelEditor.getQModel().setDataSource(mgconfig)
+        i = self._mntGrpCB.findText(activeMntGrpName,
+                                    # case insensitive find
+                                    Qt.Qt.MatchFixedString)
+        self._mntGrpCB.setCurrentIndex(i)
+        self._chModel.setDataSource(mgconfig)
         self._setDirty(True)
 
+    @Qt.pyqtSlot()
     def createMntGrp(self):
         '''creates a new Measurement Group'''
 
@@ -623,19 +726,20 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
         # add the new measurement group to the list of "dirty" groups
         self._dirtyMntGrps.add(mntGrpName)
         # add the name to the combobox
-        self.ui.activeMntGrpCB.addItem(mntGrpName)
+        self._mntGrpCB.addItem(mntGrpName)
         # make it the Active MntGrp
         self.changeActiveMntGrp(mntGrpName)
 
+    @Qt.pyqtSlot()
     def deleteMntGrp(self):
         '''creates a new Measurement Group'''
-        activeMntGrpName = str(self.ui.activeMntGrpCB.currentText())
+        activeMntGrpName = str(self._mntGrpCB.currentText())
         op = Qt.QMessageBox.question(self, "Delete Measurement Group",
                                      "Remove the measurement group '%s'?" % activeMntGrpName,
                                      Qt.QMessageBox.Yes | Qt.QMessageBox.Cancel)
         if op != Qt.QMessageBox.Yes:
             return
-        currentIndex = self.ui.activeMntGrpCB.currentIndex()
+        currentIndex = self._mntGrpCB.currentIndex()
         if self._localConfig is None:
             return
         if activeMntGrpName not in self._localConfig['MntGrpConfigs']:
@@ -645,9 +749,9 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
         self._dirtyMntGrps.add(activeMntGrpName)
 
         self._localConfig['MntGrpConfigs'][activeMntGrpName] = None
-        self.ui.activeMntGrpCB.setCurrentIndex(-1)
-        self.ui.activeMntGrpCB.removeItem(currentIndex)
-        self.ui.channelEditor.getQModel().setDataSource({})
+        self._mntGrpCB.setCurrentIndex(-1)
+        self._mntGrpCB.removeItem(currentIndex)
+        self._chModel.setDataSource({})
         self._setDirty(True)
 
     @Qt.pyqtSlot('int')
@@ -657,15 +761,31 @@ class ExpDescriptionEditor(Qt.QWidget, TaurusBaseWidget):
         self._localConfig['DataCompressionRank'] = idx - 1
         self._setDirty(True)
 
+    @Qt.pyqtSlot('QString')
     def onPathLEEdited(self, text):
         self._localConfig['ScanDir'] = str(text)
         self._setDirty(True)
 
+    @Qt.pyqtSlot('QString')
     def onFilenameLEEdited(self, text):
-        self._localConfig['ScanFile'] = [v.strip()
-                                         for v in str(text).split(',')]
+        self._filenameTimer.start()
+
+    @Qt.pyqtSlot()
+    def _flushPendingFilename(self):
+        if self._filenameTimer.isActive():
+            self._commitFilename()
+
+    @Qt.pyqtSlot()
+    def _commitFilename(self):
+        self._filenameTimer.stop()
+        text = self.ui.filenameLE.text()
+        scan_file = [v.strip() for v in str(text).split(',')]
+        if scan_file == self._localConfig['ScanFile']:
+            return
+        self._localConfig['ScanFile'] = scan_file
         self._setDirty(True)
 
+    @Qt.pyqtSlot(list)
     def onPreScanSnapshotChanged(self, items):
         door = self.getModelObj()
         ms = door.macro_server
@@ -446,6 +446,11 @@ class BaseMntGrpChannelModel(TaurusBaseModel):
         self._mgconfig = mgconfig
 
     def setDataSource(self, data_src):
+        '''reimplemented from :class:`TaurusBaseModel`
+
+        The measurement group configuration is used by reference (it is not
+        copied) and the edits done in the model are applied directly to it.
+        '''
         self._dirty = False
         TaurusBaseModel.setDataSource(self, data_src)
 
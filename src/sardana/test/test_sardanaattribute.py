@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+
+from unittest import TestCase
+
+from sardana.sardanaattribute import SardanaAttribute, ScalarNumberAttribute
+
+
+class Owner(object):
+    """Dummy owner of the attributes"""
+    name = "owner"
+
+
+class TestSardanaAttributeEvents(TestCase):
+    """Unit tests for the events fired by SardanaAttribute class"""
+
+    def setUp(self):
+        self.owner = Owner()
+        self.events = []
+        self.attr = ScalarNumberAttribute(self.owner, name="position",
+                                          listeners=self.on_change)
+
+    def on_change(self, evt_src, evt_type, evt_value):
+        self.events.append((evt_type.name, evt_type.priority))
+
+    def test_read_event(self):
+        """Test that read events are filtered and carry the priority."""
+        self.attr.set_value(1)
+        self.attr.set_value(1)
+        self.attr.set_value(1, propagate=2)
+        self.attr.set_value(2, propagate=0)
+        self.attr.set_value(3)
+        self.assertEqual(self.events, [("position", 1), ("position", 2),
+                                       ("position", 1)])
+
+    def test_write_event(self):
+        """Test that write events are prefixed with w_."""
+        self.attr.set_write_value(1)
+        self.attr.set_write_value(1, propagate=2)
+        self.attr.set_write_value(1, propagate=0)
+        self.assertEqual(self.events, [("w_position", 1), ("w_position", 2)])
+
+    def test_no_owner(self):
+        """Test that read events are not fired without owner."""
+        attr = SardanaAttribute(None, listeners=self.on_change)
+        attr.set_value(1)
+        self.assertEqual(self.events, [])
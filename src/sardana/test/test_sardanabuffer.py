@@ -25,6 +25,8 @@
 
 from unittest import TestCase
 
+import numpy
+
 from sardana.sardanabuffer import SardanaBuffer
 
 
@@ -44,6 +46,26 @@ class TestPersistentBuffer(TestCase):
         self.assertEqual(len(self.buffer), 6)
         self.assertEqual(len(self.buffer.last_chunk), 3)
 
+    def test_extend_last_chunk_order(self):
+        """Test that the last_chunk is ordered by index."""
+        self.buffer.extend([4, 5, 6, 7])
+        self.assertEqual(list(self.buffer.last_chunk), [3, 4, 5, 6])
+
+    def test_extend_empty(self):
+        """Test extend method with an empty list."""
+        self.buffer.extend([])
+        self.assertEqual(len(self.buffer), 3)
+        self.assertEqual(self.buffer.next_idx, 3)
+
+    def test_extend_numpy(self):
+        """Test extend method with a numeric numpy array."""
+        chunk = numpy.array([4., 5., 6.])
+        self.buffer.extend(chunk)
+        self.assertEqual(self.buffer.get_value(3), 4.)
+        self.assertEqual(self.buffer.get_value(5), 6.)
+        self.assertEqual(len(self.buffer), 6)
+        self.assertEqual(len(self.buffer.last_chunk), 3)
+
     def test_append(self):
         """Test if append correctly fills the last_chunk as well as permanently
         adds the value to the buffer.
@@ -89,3 +89,17 @@ class SardanaValueTestCase(unittest.TestCase):
 
         self.assertEqual(sar_val.error, False,
                          'The error attribute should be False')
+
+    def testSardanaValueFromValue(self):
+        """Verify that SardanaValue.from_value creates a value equivalent to
+            the one created by the constructor with just the value argument.
+            """
+        sar_val = SardanaValue.from_value(6)
+        self.assertIsInstance(sar_val, SardanaValue)
+        self.assertEqual(sar_val.value, 6)
+        self.assertEqual(sar_val.error, False,
+                         'The error attribute should be False')
+        self.assertIsNone(sar_val.exc_info)
+        self.assertIsNone(sar_val.dtype)
+        self.assertIsNone(sar_val.dformat)
+        self.assertIsInstance(sar_val.timestamp, float)
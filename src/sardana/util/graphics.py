@@ -26,6 +26,7 @@
 
 """This package provides graphics related helper functions"""
 
+import functools
 import os
 import sys
 
@@ -57,12 +58,20 @@ def xsession_available():
 
     :returns: True when an X-session is available. False when not.
     :rtype: bool
+
+    .. note ::
+        The result is cached for the current value of the DISPLAY
+        environment variable.
     """
+    return _xsession_available(os.environ.get("DISPLAY"))
+
 
+@functools.lru_cache(maxsize=1)
+def _xsession_available(display):
     ret_val = True
 
     # No display environment
-    if os.environ.get("DISPLAY") is None:
+    if display is None:
         ret_val = False
 
     # In docker without X-session auth